@@ -0,0 +1,95 @@
+"""
+Generate synthetic e-commerce data straight into SQLite.
+Rows go from the generators into executemany without the CSV round trip.
+Pass --csv to write the CSV files and ingest them instead.
+"""
+
+import argparse
+import os
+
+import generate_data
+import ingest_to_db
+from generate_data import (NUM_CUSTOMERS, NUM_PRODUCTS, NUM_ORDERS, yield_customers,
+                           yield_products, build_order_items, yield_orders, yield_reviews)
+from ingest_to_db import (INSERT_CUSTOMERS_SQL, INSERT_PRODUCTS_SQL, INSERT_ORDERS_SQL,
+                          INSERT_ORDER_ITEMS_SQL, INSERT_REVIEWS_SQL, create_database,
+                          create_indexes, finish_bulk_load, verify_data)
+
+
+def main_direct(db_name='ecom.db'):
+    """Generate every table directly into the database, skipping CSV files."""
+    print("=" * 60)
+    print("Generating Synthetic E-commerce Data into SQLite")
+    print("=" * 60)
+    print()
+    
+    conn, cursor = create_database(db_name)
+    
+    customer_ids = list(range(1, NUM_CUSTOMERS + 1))
+    product_ids = list(range(1, NUM_PRODUCTS + 1))
+    order_ids = list(range(1, NUM_ORDERS + 1))
+    
+    try:
+        print("\nGenerating and inserting data...")
+        with conn:
+            cursor.executemany(INSERT_CUSTOMERS_SQL, yield_customers())
+            print(f"✓ Inserted {cursor.rowcount} customers")
+            
+            cursor.executemany(INSERT_PRODUCTS_SQL, yield_products())
+            print(f"✓ Inserted {cursor.rowcount} products")
+            
+            # Order totals are known as soon as the items are drawn, so
+            # orders can go in before their items
+            order_items = build_order_items(order_ids, product_ids)
+            cursor.executemany(INSERT_ORDERS_SQL, yield_orders(
+                order_ids, customer_ids, order_items.order_totals,
+                order_items.shipping_costs))
+            print(f"✓ Inserted {cursor.rowcount} orders")
+            
+            cursor.executemany(INSERT_ORDER_ITEMS_SQL, order_items.rows)
+            print(f"✓ Inserted {cursor.rowcount} order items")
+            
+            cursor.executemany(INSERT_REVIEWS_SQL, yield_reviews(NUM_CUSTOMERS, NUM_PRODUCTS))
+            print(f"✓ Inserted {cursor.rowcount} reviews")
+        print("\n✓ All data inserted successfully")
+        
+        create_indexes(cursor)
+        conn.commit()
+        
+        # Bulk load is done; go back to safe syncing for later writes
+        finish_bulk_load(cursor)
+        
+        verify_data(cursor)
+        
+        print("\n" + "=" * 60)
+        print("Generation complete!")
+        print("=" * 60)
+        print(f"\nDatabase: {db_name}")
+        print(f"Size: {os.path.getsize(db_name) / 1024 / 1024:.2f} MB")
+        
+    except Exception as e:
+        conn.rollback()
+        print(f"\n✗ Error occurred: {e}")
+        raise
+    finally:
+        conn.close()
+
+
+def main():
+    """Parse arguments and run the direct or CSV pipeline."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--csv', action='store_true',
+                        help='write the CSV files and ingest them instead of '
+                             'inserting rows directly')
+    args = parser.parse_args()
+    
+    if args.csv:
+        generate_data.main()
+        print()
+        ingest_to_db.main()
+    else:
+        main_direct()
+
+
+if __name__ == '__main__':
+    main()
@@ -4,9 +4,14 @@ Creates 5 CSV files: customers, products, orders, order_items, and reviews.
 """
 
 import csv
-import random
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+import numpy as np
 from faker import Faker
-from datetime import datetime, timedelta
+from faker.providers.address.en_US import Provider as AddressProvider
+from datetime import date, timedelta
 
 # Initialize Faker
 fake = Faker()
@@ -17,233 +22,501 @@ NUM_PRODUCTS = 500
 NUM_ORDERS = 2000
 NUM_REVIEWS = 1500
 
+# Parallel generation settings
+NUM_WORKERS = os.cpu_count() or 1
+CHUNK_SIZE = 256  # Rows generated per worker task
+BATCH_SIZE = 10_000  # Rows buffered before each writerows call
+IO_BUFFER_SIZE = 1 << 20  # 1 MiB file buffer to cut write() syscalls
+
 # Set seed for reproducibility
-Faker.seed(42)
-random.seed(42)
+SEED = 42
+Faker.seed(SEED)
 
+# Dates are drawn as day offsets back from today (up to two years)
+TODAY = date.today()
+_DATE_STRINGS = [(TODAY - timedelta(days=d)).isoformat() for d in range(731)]
 
-def generate_customers(filename='customers.csv'):
-    """Generate customer data."""
-    print(f"Generating {NUM_CUSTOMERS} customers...")
+# Small fixed domains sampled directly
+STATES = list(AddressProvider.states_abbr)
+COUNTRIES = list(AddressProvider.countries)
+
+# Reusable Faker string pools, filled by _build_string_pools()
+CITIES = ADDRS = PHONES = ZIPS = COMPANIES = CATCH_PHRASES = None
+
+# Worker pool shared by all tables while main() runs
+_process_pool = None
+
+# Order item rows plus the per-order money they add up to; see build_order_items()
+OrderItems = namedtuple('OrderItems', ['rows', 'order_totals', 'shipping_costs'])
+
+# Stream ids keep each table's NumPy random sequence independent
+_TABLE_STREAMS = {'customers': 0, 'products': 1, 'orders': 2, 'order_items': 3, 'reviews': 4}
+
+
+def _rng(table, start=0, seed=SEED):
+    """Return the NumPy generator for one table (or one chunk of it)."""
+    return np.random.default_rng([seed, _TABLE_STREAMS[table], start])
+
+
+def _build_string_pools(seed=SEED):
+    """Pre-generate the Faker strings that rows sample from instead of calling Faker per row.
+
+    Pools are built once per run and shipped to the worker processes, so the
+    cost is paid a single time. Returns the pools as a tuple.
+    """
+    global CITIES, ADDRS, PHONES, ZIPS, COMPANIES, CATCH_PHRASES
     
-    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = ['customer_id', 'first_name', 'last_name', 'email', 
-                     'phone', 'address', 'city', 'state', 'zip_code', 'country', 
-                     'date_joined']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for i in range(1, NUM_CUSTOMERS + 1):
-            writer.writerow({
-                'customer_id': i,
-                'first_name': fake.first_name(),
-                'last_name': fake.last_name(),
-                'email': fake.unique.email(),
-                'phone': fake.phone_number(),
-                'address': fake.street_address(),
-                'city': fake.city(),
-                'state': fake.state_abbr(),
-                'zip_code': fake.zipcode(),
-                'country': fake.country(),
-                'date_joined': fake.date_between(start_date='-2y', end_date='today').isoformat()
-            })
+    if CITIES is not None:
+        return CITIES, ADDRS, PHONES, ZIPS, COMPANIES, CATCH_PHRASES
     
-    print(f"✓ Created {filename}")
+    pool_fake = Faker()
+    pool_fake.seed_instance(seed)
+    
+    CITIES = [pool_fake.city() for _ in range(2000)]
+    ADDRS = [pool_fake.street_address() for _ in range(5000)]
+    PHONES = [pool_fake.phone_number() for _ in range(5000)]
+    ZIPS = [pool_fake.zipcode() for _ in range(5000)]
+    COMPANIES = [pool_fake.company() for _ in range(2000)]
+    CATCH_PHRASES = [pool_fake.catch_phrase() for _ in range(2000)]
+    
+    return CITIES, ADDRS, PHONES, ZIPS, COMPANIES, CATCH_PHRASES
 
 
-def generate_products(filename='products.csv'):
-    """Generate product data."""
-    print(f"Generating {NUM_PRODUCTS} products...")
+def _sample(pool, rng, n):
+    """Pick n strings from a pool with the given NumPy generator."""
+    return [pool[j] for j in rng.integers(0, len(pool), n).tolist()]
+
+
+def vec_dates(rng, n, days_back):
+    """Return n ISO date strings between days_back days ago and today."""
+    return [_DATE_STRINGS[d] for d in rng.integers(0, days_back + 1, n).tolist()]
+
+
+def _worker_init(seed_base, pools):
+    """Create the process-local Faker and string pools used by the chunk generators."""
+    global fake, _seed_base, CITIES, ADDRS, PHONES, ZIPS, COMPANIES, CATCH_PHRASES
+    fake = Faker()
+    _seed_base = seed_base
+    CITIES, ADDRS, PHONES, ZIPS, COMPANIES, CATCH_PHRASES = pools
+
+
+def _seed_chunk(table, start):
+    """Seed the worker's Faker for one chunk and return a matching NumPy generator.
+
+    Seeding per chunk (rather than per process) keeps the output identical
+    no matter how chunks are distributed across workers.
+    """
+    seed = f"{_seed_base}:{table}:{start}"
+    fake.seed_instance(seed)
+    return _rng(table, start, _seed_base)
+
+
+def _new_process_pool():
+    """Create a worker pool whose processes hold a Faker and the string pools."""
+    return ProcessPoolExecutor(max_workers=NUM_WORKERS, initializer=_worker_init,
+                               initargs=(SEED, _build_string_pools()))
+
+
+def _map_chunks(chunk_fn, total):
+    """Run chunk_fn over ids 1..total in worker processes, yielding row batches in order.
+
+    Uses the shared pool set up by main() when there is one, otherwise a
+    pool of its own for the duration of the call.
+    """
+    starts = range(1, total + 1, CHUNK_SIZE)
+    ends = [min(start + CHUNK_SIZE, total + 1) for start in starts]
+    
+    if _process_pool is not None:
+        yield from _process_pool.map(chunk_fn, starts, ends)
+        return
+    
+    with _new_process_pool() as executor:
+        yield from executor.map(chunk_fn, starts, ends)
+
+
+def _gen_customer_chunk(start, end):
+    """Generate customer rows for ids in [start, end)."""
+    rng = _seed_chunk('customers', start)
+    n = end - start
+    
+    phones = _sample(PHONES, rng, n)
+    addresses = _sample(ADDRS, rng, n)
+    cities = _sample(CITIES, rng, n)
+    states = _sample(STATES, rng, n)
+    zip_codes = _sample(ZIPS, rng, n)
+    countries = _sample(COUNTRIES, rng, n)
+    joined = vec_dates(rng, n, 730)
+    
+    rows = []
+    for i, phone, address, city, state, zip_code, country, date_joined in zip(
+            range(start, end), phones, addresses, cities, states, zip_codes,
+            countries, joined):
+        rows.append((
+            i,
+            fake.first_name(),
+            fake.last_name(),
+            # fake.unique does not work across processes; the id keeps emails unique
+            f"{fake.user_name()}{i}@{fake.free_email_domain()}",
+            phone,
+            address,
+            city,
+            state,
+            zip_code,
+            country,
+            date_joined
+        ))
+    return rows
+
+
+def _gen_product_chunk(start, end):
+    """Generate product rows for ids in [start, end)."""
+    rng = _seed_chunk('products', start)
+    n = end - start
     
     categories = ['Electronics', 'Clothing', 'Home & Garden', 'Sports & Outdoors', 
                   'Books', 'Toys & Games', 'Health & Beauty', 'Automotive', 
                   'Food & Beverages', 'Office Supplies']
     
-    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = ['product_id', 'name', 'description', 'category', 'price', 
-                     'cost', 'stock_quantity', 'brand', 'sku', 'created_at']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for i in range(1, NUM_PRODUCTS + 1):
-            price = round(random.uniform(10, 500), 2)
-            cost = round(price * random.uniform(0.3, 0.7), 2)
-            
-            writer.writerow({
-                'product_id': i,
-                'name': fake.catch_phrase(),
-                'description': fake.text(max_nb_chars=200),
-                'category': random.choice(categories),
-                'price': price,
-                'cost': cost,
-                'stock_quantity': random.randint(0, 1000),
-                'brand': fake.company(),
-                'sku': fake.unique.bothify(text='SKU-####-????'),
-                'created_at': fake.date_between(start_date='-1y', end_date='today').isoformat()
-            })
+    # Draw the numeric columns in one call each
+    prices = rng.uniform(10, 500, n)
+    costs = prices * rng.uniform(0.3, 0.7, n)
+    stocks = rng.integers(0, 1001, n)
+    cats = _sample(categories, rng, n)
+    names = _sample(CATCH_PHRASES, rng, n)
+    brands = _sample(COMPANIES, rng, n)
+    created = vec_dates(rng, n, 365)
     
-    print(f"✓ Created {filename}")
+    rows = []
+    for i, name, category, price, cost, stock, brand, created_at in zip(
+            range(start, end), names, cats, prices.tolist(),
+            costs.tolist(), stocks.tolist(), brands, created):
+        rows.append((
+            i,
+            name,
+            fake.text(max_nb_chars=200),
+            category,
+            f"{price:.2f}",
+            f"{cost:.2f}",
+            stock,
+            brand,
+            # fake.unique does not work across processes; the id keeps SKUs unique
+            f"SKU-{i:04d}-{fake.lexify(text='????')}",
+            created_at
+        ))
+    return rows
 
 
-def generate_orders(filename='orders.csv', customer_ids=None):
-    """Generate order data."""
-    print(f"Generating {NUM_ORDERS} orders...")
+def _gen_review_chunk(num_customers, num_products, start, end):
+    """Generate review rows for ids in [start, end).
+
+    Customer and product ids are the dense ranges 1..num_customers and
+    1..num_products, so only the bounds are sent to the worker.
+    """
+    rng = _seed_chunk('reviews', start)
+    n = end - start
     
-    statuses = ['pending', 'processing', 'shipped', 'delivered', 'cancelled']
+    review_products = rng.integers(1, num_products + 1, n)
+    review_customers = rng.integers(1, num_customers + 1, n)
+    ratings = rng.integers(1, 6, n)
+    verified = rng.choice([True, False], n)
+    review_dates = vec_dates(rng, n, 365)
     
-    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = ['order_id', 'customer_id', 'order_date', 'status', 
-                     'shipping_address', 'shipping_city', 'shipping_state', 
-                     'shipping_zip', 'shipping_cost', 'total_amount']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+    rows = []
+    for i, product_id, customer_id, rating, is_verified, review_date in zip(
+            range(start, end), review_products.tolist(), review_customers.tolist(),
+            ratings.tolist(), verified.tolist(), review_dates):
+        rows.append((
+            i,
+            product_id,
+            customer_id,
+            rating,
+            fake.text(max_nb_chars=500),
+            review_date,
+            is_verified
+        ))
+    return rows
+
+
+def write_csv(rows, filename, fieldnames):
+    """Write a header plus rows to filename in BATCH_SIZE batches; returns the row count.
+
+    Each full batch is handed to a background writer thread, so formatting and
+    writing one batch overlaps with generating the next. At most one batch is
+    in flight at a time.
+    """
+    count = 0
+    with open(filename, 'w', newline='', encoding='utf-8',
+              buffering=IO_BUFFER_SIZE) as csvfile, \
+            ThreadPoolExecutor(max_workers=1) as write_executor:
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
         
-        for i in range(1, NUM_ORDERS + 1):
-            order_date = fake.date_between(start_date='-1y', end_date='today')
-            
-            writer.writerow({
-                'order_id': i,
-                'customer_id': random.choice(customer_ids),
-                'order_date': order_date.isoformat(),
-                'status': random.choice(statuses),
-                'shipping_address': fake.street_address(),
-                'shipping_city': fake.city(),
-                'shipping_state': fake.state_abbr(),
-                'shipping_zip': fake.zipcode(),
-                'shipping_cost': round(random.uniform(5, 25), 2),
-                'total_amount': 0  # Will be calculated from order_items
-            })
+        pending = None
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= BATCH_SIZE:
+                if pending is not None:
+                    pending.result()
+                pending = write_executor.submit(writer.writerows, batch)
+                count += len(batch)
+                batch = []
+        
+        if pending is not None:
+            pending.result()
+        writer.writerows(batch)
+        count += len(batch)
     
-    print(f"✓ Created {filename}")
+    return count
 
 
-def generate_order_items(filename='order_items.csv', order_ids=None, product_ids=None):
-    """Generate order items data."""
-    print(f"Generating order items...")
+def write_unquoted_csv(rows, filename, fieldnames):
+    """Write rows whose fields never need quoting; returns the row count.
+
+    Skips the csv module: each row is formatted with one pre-built template
+    into a byte buffer that is written out every IO_BUFFER_SIZE bytes. The
+    output matches csv.writer's for such rows. Only use it for tables whose
+    columns are all numeric or otherwise comma- and quote-free.
+    """
+    row_format = ','.join(['{}'] * len(fieldnames)) + '\r\n'
     
-    order_items = []
-    order_totals = {}  # Track totals for each order
+    count = 0
+    with open(filename, 'wb') as csvfile:
+        buf = bytearray(row_format.format(*fieldnames).encode())
+        for row in rows:
+            buf += row_format.format(*row).encode()
+            count += 1
+            if len(buf) >= IO_BUFFER_SIZE:
+                csvfile.write(buf)
+                buf.clear()
+        
+        csvfile.write(buf)
+    
+    return count
+
+
+def yield_customers():
+    """Yield customer rows."""
+    for rows in _map_chunks(_gen_customer_chunk, NUM_CUSTOMERS):
+        yield from rows
+
+
+def yield_products():
+    """Yield product rows."""
+    for rows in _map_chunks(_gen_product_chunk, NUM_PRODUCTS):
+        yield from rows
+
+
+def build_order_items(order_ids, product_ids):
+    """Draw every order item up front and return an OrderItems.
+
+    All random draws happen here, so order_totals and shipping_costs (lists
+    indexed by order_id, in integer cents) are complete on return, before any
+    row is read from rows.
+    """
+    rng = _rng('order_items')
+    
+    # Draw the per-order and per-item numeric columns up front. Money is kept
+    # in integer cents so subtotals and totals are exact without rounding.
+    shipping = rng.integers(500, 2501, len(order_ids))
+    num_items = rng.integers(1, 6, len(order_ids))  # 1-5 items per order
+    num_items = np.minimum(num_items, len(product_ids))
+    total_items = int(num_items.sum())
+    quantities = rng.integers(1, 6, total_items)
+    unit_prices = rng.integers(1000, 50001, total_items)
+    subtotals = unit_prices * quantities
+    
+    # Each order draws its products independently: one vectorized draw of
+    # candidate indexes, with the few orders that got a duplicate redrawn
+    counts = num_items.tolist()
+    picks = rng.integers(0, len(product_ids), (len(order_ids), max(counts))).tolist()
+    for pick, count in zip(picks, counts):
+        if len(set(pick[:count])) < count:
+            pick[:count] = rng.choice(len(product_ids), count, replace=False).tolist()
+    
+    # Order ids are a dense integer range, so plain lists beat dicts here
+    shipping_costs = [0] * (max(order_ids) + 1)
+    for order_id, cost in zip(order_ids, shipping.tolist()):
+        shipping_costs[order_id] = cost
+    
+    order_totals = np.zeros(max(order_ids) + 1, dtype=np.int64)
+    np.add.at(order_totals, np.repeat(order_ids, num_items), subtotals)
+    
+    rows = _yield_order_item_rows(order_ids, product_ids, counts, picks, quantities.tolist(),
+                                  unit_prices.tolist(), subtotals.tolist())
+    return OrderItems(rows, order_totals.tolist(), shipping_costs)
+
+
+def _yield_order_item_rows(order_ids, product_ids, counts, picks, quantities, unit_prices,
+                           subtotals):
+    """Yield order item rows from the columns drawn by build_order_items."""
+    order_item_id = 0
     
     # Generate multiple items per order
-    for order_id in order_ids:
-        num_items = random.randint(1, 5)  # 1-5 items per order
-        selected_products = random.sample(product_ids, min(num_items, len(product_ids)))
-        
-        for product_id in selected_products:
-            quantity = random.randint(1, 5)
-            unit_price = round(random.uniform(10, 500), 2)
-            subtotal = round(unit_price * quantity, 2)
-            
-            order_items.append({
-                'order_item_id': len(order_items) + 1,
-                'order_id': order_id,
-                'product_id': product_id,
-                'quantity': quantity,
-                'unit_price': unit_price,
-                'subtotal': subtotal
-            })
+    for order_id, count, pick in zip(order_ids, counts, picks):
+        for j in pick[:count]:
+            quantity = quantities[order_item_id]
+            unit_price = unit_prices[order_item_id]
+            subtotal = subtotals[order_item_id]
             
-            # Track order totals
-            if order_id not in order_totals:
-                order_totals[order_id] = 0
-            order_totals[order_id] += subtotal
-    
-    # Write order items
-    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = ['order_item_id', 'order_id', 'product_id', 'quantity', 
-                     'unit_price', 'subtotal']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+            order_item_id += 1
+            yield (order_item_id, order_id, product_ids[j], quantity,
+                   f"{unit_price / 100:.2f}", f"{subtotal / 100:.2f}")
+
+
+def yield_orders(order_ids, customer_ids, order_totals, shipping_costs):
+    """Yield order rows, with totals taken from the order items pass."""
+    rng = _rng('orders')
+    _build_string_pools()
+    
+    statuses = ['pending', 'processing', 'shipped', 'delivered', 'cancelled']
+    order_customers = rng.choice(customer_ids, len(order_ids)).tolist()
+    order_statuses = _sample(statuses, rng, len(order_ids))
+    addresses = _sample(ADDRS, rng, len(order_ids))
+    cities = _sample(CITIES, rng, len(order_ids))
+    states = _sample(STATES, rng, len(order_ids))
+    zip_codes = _sample(ZIPS, rng, len(order_ids))
+    order_dates = vec_dates(rng, len(order_ids), 365)
+    
+    for order_id, customer_id, order_date, status, address, city, state, zip_code in zip(
+            order_ids, order_customers, order_dates, order_statuses, addresses,
+            cities, states, zip_codes):
+        shipping_cost = shipping_costs[order_id]
         
-        for item in order_items:
-            writer.writerow(item)
+        yield (
+            order_id,
+            customer_id,
+            order_date,
+            status,
+            address,
+            city,
+            state,
+            zip_code,
+            f"{shipping_cost / 100:.2f}",
+            f"{(order_totals[order_id] + shipping_cost) / 100:.2f}"
+        )
+
+
+def yield_reviews(num_customers=NUM_CUSTOMERS, num_products=NUM_PRODUCTS):
+    """Yield review rows for customer ids 1..num_customers and product ids 1..num_products."""
+    chunk_fn = partial(_gen_review_chunk, num_customers, num_products)
+    for rows in _map_chunks(chunk_fn, NUM_REVIEWS):
+        yield from rows
+
+
+def generate_customers(filename='customers.csv'):
+    """Generate customer data."""
+    print(f"Generating {NUM_CUSTOMERS} customers...")
     
-    print(f"✓ Created {filename} with {len(order_items)} items")
+    fieldnames = ['customer_id', 'first_name', 'last_name', 'email', 
+                 'phone', 'address', 'city', 'state', 'zip_code', 'country', 
+                 'date_joined']
+    write_csv(yield_customers(), filename, fieldnames)
     
-    # Update order totals in orders.csv
-    update_order_totals('orders.csv', order_totals)
+    print(f"✓ Created {filename}")
+
+
+def generate_products(filename='products.csv'):
+    """Generate product data."""
+    print(f"Generating {NUM_PRODUCTS} products...")
+    
+    fieldnames = ['product_id', 'name', 'description', 'category', 'price', 
+                 'cost', 'stock_quantity', 'brand', 'sku', 'created_at']
+    write_csv(yield_products(), filename, fieldnames)
     
-    return order_totals
+    print(f"✓ Created {filename}")
 
 
-def update_order_totals(filename, order_totals):
-    """Update total_amount in orders.csv based on order_items."""
-    print("Updating order totals...")
+def generate_order_items_and_orders_meta(filename='order_items.csv', order_ids=None,
+                                         product_ids=None):
+    """Generate order items data plus the per-order totals and shipping costs."""
+    print(f"Generating order items...")
     
-    # Read existing orders
-    orders = []
-    with open(filename, 'r', newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            order_id = int(row['order_id'])
-            if order_id in order_totals:
-                # Add shipping cost to total
-                shipping_cost = float(row['shipping_cost'])
-                row['total_amount'] = round(order_totals[order_id] + shipping_cost, 2)
-            orders.append(row)
+    order_items = build_order_items(order_ids, product_ids)
     
-    # Write updated orders
-    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = ['order_id', 'customer_id', 'order_date', 'status', 
-                     'shipping_address', 'shipping_city', 'shipping_state', 
-                     'shipping_zip', 'shipping_cost', 'total_amount']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(orders)
+    fieldnames = ['order_item_id', 'order_id', 'product_id', 'quantity', 
+                 'unit_price', 'subtotal']
+    # Every order item column is numeric, so the csv module can be skipped
+    count = write_unquoted_csv(order_items.rows, filename, fieldnames)
     
-    print("✓ Updated order totals")
+    print(f"✓ Created {filename} with {count} items")
+    
+    return order_items.order_totals, order_items.shipping_costs
 
 
-def generate_reviews(filename='reviews.csv', customer_ids=None, product_ids=None):
+def generate_orders(filename='orders.csv', order_ids=None, customer_ids=None,
+                    order_totals=None, shipping_costs=None):
+    """Generate order data, with totals taken from the order items pass."""
+    print(f"Generating {NUM_ORDERS} orders...")
+    
+    fieldnames = ['order_id', 'customer_id', 'order_date', 'status', 
+                 'shipping_address', 'shipping_city', 'shipping_state', 
+                 'shipping_zip', 'shipping_cost', 'total_amount']
+    write_csv(yield_orders(order_ids, customer_ids, order_totals, shipping_costs),
+              filename, fieldnames)
+    
+    print(f"✓ Created {filename}")
+
+
+def generate_reviews(filename='reviews.csv', num_customers=NUM_CUSTOMERS,
+                     num_products=NUM_PRODUCTS):
     """Generate review data."""
     print(f"Generating {NUM_REVIEWS} reviews...")
     
-    ratings = [1, 2, 3, 4, 5]
-    
-    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = ['review_id', 'product_id', 'customer_id', 'rating', 
-                     'review_text', 'review_date', 'verified_purchase']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for i in range(1, NUM_REVIEWS + 1):
-            writer.writerow({
-                'review_id': i,
-                'product_id': random.choice(product_ids),
-                'customer_id': random.choice(customer_ids),
-                'rating': random.choice(ratings),
-                'review_text': fake.text(max_nb_chars=500),
-                'review_date': fake.date_between(start_date='-1y', end_date='today').isoformat(),
-                'verified_purchase': random.choice([True, False])
-            })
+    fieldnames = ['review_id', 'product_id', 'customer_id', 'rating', 
+                 'review_text', 'review_date', 'verified_purchase']
+    write_csv(yield_reviews(num_customers, num_products), filename, fieldnames)
     
     print(f"✓ Created {filename}")
 
 
+def _generate_files(customer_ids, product_ids, order_ids):
+    """Write all five CSV files, running the independent ones on threads."""
+    # Customers, products and reviews mostly wait on the shared process pool,
+    # so threads are enough to run them side by side with the orders below
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(generate_customers, 'customers.csv'),
+            executor.submit(generate_products, 'products.csv'),
+            executor.submit(generate_reviews, 'reviews.csv', NUM_CUSTOMERS, NUM_PRODUCTS),
+        ]
+        
+        # Generate order items first so orders can be written with final totals
+        order_totals, shipping_costs = generate_order_items_and_orders_meta(
+            'order_items.csv', order_ids, product_ids)
+        
+        # Generate orders
+        generate_orders('orders.csv', order_ids, customer_ids, order_totals, shipping_costs)
+        
+        for future in futures:
+            future.result()
+
+
 def main():
     """Main function to generate all CSV files."""
+    global _process_pool
+    
     print("=" * 60)
     print("Generating Synthetic E-commerce Data")
     print("=" * 60)
     print()
     
-    # Generate customers
-    generate_customers('customers.csv')
+    # Files only depend on the id ranges, not on each other's contents
     customer_ids = list(range(1, NUM_CUSTOMERS + 1))
-    
-    # Generate products
-    generate_products('products.csv')
     product_ids = list(range(1, NUM_PRODUCTS + 1))
-    
-    # Generate orders
-    generate_orders('orders.csv', customer_ids)
     order_ids = list(range(1, NUM_ORDERS + 1))
     
-    # Generate order items (this also updates order totals)
-    generate_order_items('order_items.csv', order_ids, product_ids)
-    
-    # Generate reviews
-    generate_reviews('reviews.csv', customer_ids, product_ids)
+    # One process pool serves every table, so the threads share NUM_WORKERS
+    # workers instead of each starting their own. The no-op task starts all
+    # workers now, before any thread exists: forking a process that already
+    # runs threads can deadlock.
+    _process_pool = _new_process_pool()
+    _process_pool.submit(int).result()
+    try:
+        _generate_files(customer_ids, product_ids, order_ids)
+    finally:
+        _process_pool.shutdown()
+        _process_pool = None
     
     print()
     print("=" * 60)